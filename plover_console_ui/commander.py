@@ -38,11 +38,7 @@ class Commander:
         handler_name = state.pop(0)
         done = False
         while not done:
-            handler = next(
-                h
-                for h in handler.sub_commands()
-                if h.name.lower() == handler_name.lower()
-            )
+            handler = handler.find_sub_command(handler_name)
             if not handler.sub_commands() or not state:
                 done = True
             else:
@@ -62,19 +58,14 @@ class Commander:
         handler = self.current_handler()
 
         possible_command = peek(words)
-        done = False
-        while possible_command and not done:
-            found_command = False
-            for c in handler.sub_commands():
-                if c.name.lower().startswith(possible_command.lower()):
-                    found_command = True
-                    local_state.append(c.name)
-                    handler = c
-                    _ = words.pop(0)
-                    possible_command = peek(words)
-                    break
-            if not found_command:
-                done = True
+        while possible_command:
+            c = handler.find_sub_command(possible_command)
+            if c is None:
+                break
+            local_state.append(c.name)
+            handler = c
+            _ = words.pop(0)
+            possible_command = peek(words)
 
         if not handler.handle(words):
             self.state = local_state
@@ -1,5 +1,5 @@
 from os.path import isfile
-from functools import partial
+from functools import lru_cache, partial
 
 from prompt_toolkit.application import get_app
 
@@ -18,15 +18,58 @@ class UnsupportedCommand(Exception):
     pass
 
 
+# installed plugins only change on restart, so walk the registry once
+@lru_cache(maxsize=None)
+def _machines():
+    return registry.list_plugins("machine")
+
+
+@lru_cache(maxsize=None)
+def _systems():
+    return registry.list_plugins("system")
+
+
+@lru_cache(maxsize=None)
+def _machine_option_info(machine_name):
+    return registry.get_plugin("machine", machine_name).obj.get_option_info()
+
+
 class Command:
-    def __init__(self, name, output, sub_commands=[]) -> None:
+    def __init__(self, name, output, sub_commands=None) -> None:
         self.name = name
         self.output = output
-        self._sub_commands = sub_commands
+        self._sub_commands = () if sub_commands is None else sub_commands
+        self._compiled_cache = None
 
     def sub_commands(self):
         return self._sub_commands
 
+    def _compiled(self):
+        # cache is keyed on list identity because some subclasses
+        # rebuild their sub-command list on every sub_commands() call
+        sub_commands = self.sub_commands()
+        cache = self._compiled_cache
+        if cache is None or cache[0] is not sub_commands:
+            by_name = {sc.name.lower(): sc for sc in sub_commands}
+            help_text = "\n".join(
+                f"{sc.name}: {sc.__doc__ if sc.__doc__ else '...'}"
+                for sc in sub_commands
+            )
+            cache = (sub_commands, by_name, help_text)
+            self._compiled_cache = cache
+        return cache
+
+    def find_sub_command(self, word):
+        _, by_name, _ = self._compiled()
+        word = word.lower()
+        found = by_name.get(word)
+        if found:
+            return found
+        for name, sc in by_name.items():
+            if name.startswith(word):
+                return sc
+        return None
+
     def handle(self, words=[]):
         if words:
             if words[0].lower().startswith("help"):
@@ -40,14 +83,13 @@ class Command:
     def describe(self):
         if self.name:
             self.output(self.name.capitalize())
-            self.output("".join(["-" for _ in self.name]))
+            self.output("-" * len(self.name))
         else:
             self.output("----")
 
-        if self.sub_commands():
-            for sc in self.sub_commands():
-                desc = sc.__doc__ if sc.__doc__ else "..."
-                self.output(f"{sc.name}: {desc}")
+        _, _, help_text = self._compiled()
+        if help_text:
+            self.output(help_text)
 
 
 class SetBackgroundColor(Command):
@@ -180,19 +222,16 @@ class Output(Command):
 
     def handle(self, words=[]):
         with self.engine:
-            if self.engine.output:
-                self.engine.output = False
-                self.output("Output: off")
-            else:
-                self.engine.output = True
-                self.output("Output: on")
+            enable = not self.engine.output
+            self.engine.output = enable
+        self.output(f"Output: {'on' if enable else 'off'}")
         return True
 
 
 class Machine(Command):
     def __init__(self, output, engine) -> None:
         sub_commands = [MachineOptions(output, engine)] + [
-            SetMachine(p.name, output, engine) for p in registry.list_plugins("machine")
+            SetMachine(p.name, output, engine) for p in _machines()
         ]
         super().__init__("machine", output, sub_commands)
 
@@ -200,7 +239,7 @@ class Machine(Command):
 class System(Command):
     def __init__(self, output, engine) -> None:
         sub_commands = [
-            SetSystem(p.name, output, engine) for p in registry.list_plugins("system")
+            SetSystem(p.name, output, engine) for p in _systems()
         ]
         super().__init__("system", output, sub_commands)
 
@@ -225,10 +264,9 @@ class MachineOptions(Command):
 
     def sub_commands(self):
         machine_name = self.engine.config["machine_type"]
-        machine_class = registry.get_plugin("machine", machine_name).obj
         return [
             SetMachineOption(self.output, name, default, self.engine)
-            for name, default in machine_class.get_option_info().items()
+            for name, default in _machine_option_info(machine_name).items()
         ]
 
 
@@ -17,7 +17,11 @@ class Tape(Frame):
         )
         self.engine = None
         self._all_keys = None
-        self._all_keys_filler = None
+        self._template = None
+        self._key_slice = None
+        self._key_bytes = None
+        self._key_order = None
+        self._number_keys = None
 
     def on(self):
         self.engine.hook_connect("stroked", self.on_stroked)
@@ -28,17 +32,29 @@ class Tape(Frame):
     def on_config_changed(self, update):
         if "system_name" in update:
             self._all_keys = "".join(key.strip("-") for key in system.KEYS)
-            self._all_keys_filler = [" " * wcwidth(k) for k in self._all_keys]
-            self._numbers = set(system.NUMBERS.values())
+            self._key_slice = []
+            self._key_bytes = []
+            offset = 0
+            for key in self._all_keys:
+                width = wcwidth(key)
+                self._key_slice.append((offset, offset + width))
+                self._key_bytes.append(key.encode("utf-8"))
+                offset += width
+            self._template = bytearray(b" " * offset)
+            self._key_order = system.KEY_ORDER
+            self._number_keys = frozenset(system.NUMBERS.values())
             # needs +2 to account for the Frame edges
             self.container.width = len(self._all_keys) + 2
 
     def on_stroked(self, stroke):
-        text = self._all_keys_filler * 1
-        keys = stroke.steno_keys[:]
-        if any(key in self._numbers for key in keys):
-            keys.append("#")
-        for key in keys:
-            index = system.KEY_ORDER[key]
-            text[index] = self._all_keys[index]
-        output_to_buffer(self.body.buffer, "".join(text))
+        key_order = self._key_order
+        keys = set(stroke.steno_keys)
+        if keys & self._number_keys:
+            keys.add("#")
+        buf = self._template[:]
+        # write right-to-left so a multi-byte key resizing the buffer
+        # cannot shift the slices of keys before it
+        for index in sorted((key_order[key] for key in keys), reverse=True):
+            start, end = self._key_slice[index]
+            buf[start:end] = self._key_bytes[index]
+        output_to_buffer(self.body.buffer, buf.decode("utf-8"))